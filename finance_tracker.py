@@ -12,8 +12,11 @@ Features:
   balance.
 * Show a basic bar chart that breaks down spending by category.
 
-The application uses only the Python standard library (no external
-dependencies). Data is persisted to a JSON file in the current directory.
+The application needs only the Python standard library. orjson is an
+optional speedup: when installed, it reads and writes the data file.
+Data is persisted to a JSON file in the current directory; new
+transactions are appended to a companion ``.log`` file (one JSON object
+per line) and merged into the JSON file when the application closes.
 
 How to run:
     python finance_tracker.py
@@ -25,9 +28,19 @@ your transactions, summary, and analytics.
 """
 
 import json
+import math
 import os
+import re
 from datetime import datetime
-from collections import defaultdict
+from bisect import insort
+from functools import lru_cache
+from typing import NamedTuple
+
+try:
+    import orjson  # type: ignore
+except ImportError:
+    # Optional faster JSON codec; the json module is used otherwise.
+    orjson = None  # type: ignore
 
 try:
     import tkinter as tk  # type: ignore
@@ -41,105 +54,350 @@ except ImportError:
     messagebox = None  # type: ignore
 
 
+# Same shapes strptime("%Y-%m-%d") accepts: month and day may be one digit.
+_DATE_RE = re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2})", re.ASCII)
+
+
+def _json_loads(data: bytes):
+    """Parse JSON from raw bytes, using orjson when available."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejects the NaN/Infinity tokens the json module writes;
+            # let json.loads have a go before treating the data as corrupt.
+            pass
+    return json.loads(data)
+
+
+def _json_dumps(obj, pretty: bool = False) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        # Match orjson's OPT_INDENT_2 so exports look the same either way.
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+@lru_cache(maxsize=512)
+def _valid_date(date_str: str) -> bool:
+    """Return True if date_str is a real calendar date in YYYY-MM-DD format."""
+    match = _DATE_RE.fullmatch(date_str)
+    if match is None:
+        return False
+    # The datetime constructor range-checks the fields far faster than strptime.
+    try:
+        datetime(*map(int, match.groups()))
+    except ValueError:
+        return False
+    return True
+
+
+class Transaction(NamedTuple):
+    """A single recorded transaction."""
+
+    date: str
+    description: str
+    category: str
+    amount: float
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Transaction":
+        """
+        Build a transaction from a stored JSON object, filling in defaults.
+
+        :raises ValueError: if the amount is not a finite number.
+        """
+        amount = float(data.get("amount") or 0.0)
+        if not math.isfinite(amount):
+            raise ValueError(f"amount must be a finite number, got {amount!r}")
+        return cls(
+            str(data.get("date") or ""),
+            str(data.get("description") or ""),
+            str(data.get("category") or "Uncategorized"),
+            amount,
+        )
+
+
 class FinanceTracker:
     """Manages the storage and retrieval of financial transactions."""
 
     def __init__(self, file_path: str) -> None:
         self.file_path = file_path
-        self.transactions = []  # type: list[dict[str, object]]
+        # New transactions are appended to a JSON Lines log next to the main
+        # file and only merged into it on close or an explicit save(). The
+        # suffix is appended, so the log can never collide with file_path.
+        self.log_path = file_path + ".log"
+        self.transactions = []  # type: list[Transaction]
+        self._dirty = False
+        self._batching = False
+        # Set when the JSON file exists but could not be read; save() then
+        # leaves it alone rather than overwriting the user's history.
+        self._load_failed = False
+        # Running totals, kept up to date by add_transaction().
+        self._income = 0.0
+        self._expenses = 0.0
+        self._breakdown: dict[str, float] = {}
+        # Known category names, kept sorted for the category picker.
+        self._category_set: set[str] = set()
+        self._categories_sorted: list[str] = []
+        # Opened on the first add so a read-only directory does not stop
+        # the tracker from loading.
+        self._log = None
         self.load()
 
+    def __enter__(self) -> "FinanceTracker":
+        """Enter batch mode: appended transactions are not flushed per add."""
+        self._batching = True
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Leave batch mode and compact the batch into the JSON file."""
+        self._batching = False
+        self.save()
+
     def load(self) -> None:
-        """Load transactions from the JSON file, if it exists."""
-        if os.path.exists(self.file_path):
+        """Load transactions from the JSON file and replay the append log."""
+        self.transactions = []
+        self._load_failed = False
+        try:
+            with open(self.file_path, "rb") as f:
+                data = _json_loads(f.read())
+            # ensure list of dicts
+            if isinstance(data, list):
+                self.transactions = self._parse_records(data)
+            else:
+                self._load_failed = True
+        except FileNotFoundError:
+            pass
+        except (ValueError, OSError):
+            # invalid file or cannot read; start fresh but keep the file
+            self._load_failed = True
+        # Transactions appended since the last compaction. Each log line
+        # carries its position in the full list as "seq"; lines already in
+        # the JSON file (left over if a compaction was interrupted before
+        # the log was truncated) are skipped.
+        compacted = len(self.transactions)
+        records = []
+        try:
+            with open(self.log_path, "rb") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    self._dirty = True
+                    try:
+                        record = _json_loads(line)
+                        if isinstance(record, dict) and record.get("seq", compacted) < compacted:
+                            continue
+                    except (ValueError, TypeError):
+                        # a torn or corrupt line; skip it and keep the rest
+                        continue
+                    records.append(record)
+        except FileNotFoundError:
+            pass
+        except OSError:
+            # cannot read the log; keep what was read so far
+            pass
+        self.transactions.extend(self._parse_records(records))
+        self._category_set = {t.category for t in self.transactions}
+        self._categories_sorted = sorted(self._category_set)
+        self._recompute_totals()
+
+    @staticmethod
+    def _parse_records(records: list) -> list[Transaction]:
+        """
+        Convert stored JSON objects to transactions, skipping any that are
+        not objects or hold an invalid amount. Normalizing once here means
+        the totals never need to coerce per row.
+        """
+        transactions = []
+        for record in records:
+            if not isinstance(record, dict):
+                continue
             try:
-                with open(self.file_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                # ensure list of dicts
-                if isinstance(data, list):
-                    self.transactions = data
-                else:
-                    self.transactions = []
-            except (json.JSONDecodeError, OSError):
-                # invalid file or cannot read; start fresh
-                self.transactions = []
+                transactions.append(Transaction.from_dict(record))
+            except (ValueError, TypeError):
+                continue
+        return transactions
+
+    def _recompute_totals(self) -> None:
+        """Rebuild the running totals from every loaded transaction."""
+        self._income = 0.0
+        self._expenses = 0.0
+        self._breakdown = {}
+        for t in self.transactions:
+            self._accumulate(t.category, t.amount)
+
+    def _accumulate(self, category: str, amount: float) -> None:
+        """Fold a single transaction into the running totals."""
+        breakdown = self._breakdown
+        if amount >= 0:
+            self._income += amount
+            breakdown[category] = breakdown.get(category, 0.0) + amount
         else:
-            self.transactions = []
+            self._expenses += -amount
+            # Represent expenses as positive values in the breakdown.
+            breakdown[category] = breakdown.get(category, 0.0) - amount
 
-    def save(self) -> None:
-        """Persist current transactions to the JSON file."""
+    def flush(self) -> None:
+        """Push buffered log writes to the operating system."""
+        if self._log is None:
+            return
         try:
-            with open(self.file_path, "w", encoding="utf-8") as f:
-                json.dump(self.transactions, f, indent=4)
+            self._log.flush()
         except OSError:
+            self._drop_log()
 
+    def _drop_log(self) -> None:
+        """Discard a log handle that failed; the next add reopens it."""
+        try:
+            self._log.close()
+        except OSError:
             pass
+        self._log = None
+
+    def save(self, compact: bool = True) -> None:
+        """
+        Persist current transactions.
+
+        :param compact: Rewrite the JSON file with every transaction and
+            truncate the append log. When False, only flush the log.
+        """
+        if not compact or self._load_failed:
+            # Never compact over a JSON file that failed to load; new
+            # transactions stay in the log instead.
+            self.flush()
+            return
+        # Serialize up front so the file receives a single write instead of
+        # one per JSON token.
+        payload = _json_dumps([t._asdict() for t in self.transactions])
+        # Write to a temporary file and rename it over the original so a
+        # crash mid-write never leaves a truncated JSON file behind.
+        tmp_path = self.file_path + ".tmp"
+        try:
+            with open(tmp_path, "wb", buffering=1 << 20) as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.file_path)
+        except OSError:
+            # don't leave a half-written temporary file behind
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return
+        try:
+            if self._log is not None:
+                self._log.seek(0)
+                self._log.truncate()
+            else:
+                with open(self.log_path, "r+b") as f:
+                    f.truncate()
+        except FileNotFoundError:
+            pass
+        except OSError:
+            return
+        self._dirty = False
+
+    def export(self, path: str) -> None:
+        """Write all transactions to path as indented, human-readable JSON."""
+        with open(path, "wb") as f:
+            f.write(_json_dumps([t._asdict() for t in self.transactions], pretty=True))
+
+    def close(self) -> None:
+        """Compact pending log entries into the JSON file and close the log."""
+        if self._dirty:
+            self.save()
+        if self._log is not None:
+            self._drop_log()
 
     def add_transaction(
         self, date_str: str, description: str, category: str, amount: float
     ) -> None:
         """
-        Add a transaction to the list and save it.
+        Add a transaction to the list and append it to the log.
 
         :param date_str: Date of the transaction as a string (YYYY‑MM‑DD).
         :param description: Description of the transaction.
         :param category: Category (e.g., Food, Salary).
         :param amount: Positive for income, negative for expense.
+        :raises ValueError: if amount is not a finite number.
         """
-        transaction = {
-            "date": date_str,
-            "description": description,
-            "category": category,
-            "amount": amount,
-        }
+        amount = float(amount)
+        if not math.isfinite(amount):
+            raise ValueError(f"amount must be a finite number, got {amount!r}")
+        transaction = Transaction(date_str, description, category, amount)
         self.transactions.append(transaction)
-        self.save()
+        self._accumulate(category, amount)
+        if category not in self._category_set:
+            self._category_set.add(category)
+            insort(self._categories_sorted, category)
+        self._dirty = True
+        try:
+            if self._log is None:
+                self._log = open(self.log_path, "ab", buffering=64 * 1024)
+            record = transaction._asdict()
+            # Without a loaded JSON file positions are unknown; unnumbered
+            # lines are always replayed.
+            if not self._load_failed:
+                record["seq"] = len(self.transactions) - 1
+            self._log.write(_json_dumps(record) + b"\n")
+        except OSError:
+            # Cannot append right now; the transaction stays in memory and
+            # is written out by the next successful save().
+            if self._log is not None:
+                self._drop_log()
+            return
+        if not self._batching:
+            self.flush()
 
-    def get_transactions(self) -> list[dict[str, object]]:
+    def get_transactions(self) -> list[Transaction]:
         """Return a copy of all recorded transactions."""
         return list(self.transactions)
 
+    def get_categories(self) -> list[str]:
+        """Return the sorted list of categories used by recorded transactions."""
+        return list(self._categories_sorted)
+
     def compute_summary(self) -> tuple[float, float, float]:
         """
         Compute total income, total expenses, and net balance.
 
         :return: (total_income, total_expenses, net_balance)
         """
-        total_income = 0.0
-        total_expenses = 0.0
-        for t in self.transactions:
-            amt = float(t.get("amount", 0) or 0)
-            if amt >= 0:
-                total_income += amt
-            else:
-                total_expenses += -amt
-        net = total_income - total_expenses
-        return total_income, total_expenses, net
+        return self._income, self._expenses, self._income - self._expenses
 
     def category_breakdown(self) -> dict[str, float]:
         """
         Return a breakdown of totals per category. Expenses are stored as positive
         values for the breakdown (i.e., absolute value).
         """
-        breakdown: defaultdict[str, float] = defaultdict(float)
-        for t in self.transactions:
-            cat = str(t.get("category", "Uncategorized"))
-            amt = float(t.get("amount", 0) or 0)
-            # Represent expenses as positive values in the breakdown.
-            value = -amt if amt < 0 else amt
-            breakdown[cat] += value
-        return dict(breakdown)
+        return dict(self._breakdown)
 
 
 class FinanceApp:
     """Graphical user interface for the FinanceTracker."""
 
+    # Chart styling shared by every canvas item
+    _FONT_SMALL = ("Arial", 8)
+    _BAR_FILL = "#4A90E2"
+
     def __init__(self, master) -> None:
         self.master = master
         self.master.title("Personal Finance Tracker")
         self.master.geometry("700x500")
         # Initialize tracker
         self.tracker = FinanceTracker("transactions.json")
+        # Summary redraws are coalesced into one idle callback
+        self._redraw_pending = False
+        # Set when the chart is out of date but its tab is not showing
+        self._summary_dirty = False
+        # What the chart currently shows, so unchanged redraws can be skipped
+        self._last_chart_sig = None  # type: tuple | None
+        self._chart_layout = None  # type: tuple | None
+        self._chart_items = []  # type: list[tuple[int, int]]
         # Build user interface
         self._build_ui()
         # Populate initial data
@@ -151,6 +409,7 @@ class FinanceApp:
         # Notebook with three tabs
         self.notebook = ttk.Notebook(self.master)
         self.notebook.pack(fill=tk.BOTH, expand=True)
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
 
         # Frames for each tab
         self.tab_add = ttk.Frame(self.notebook)
@@ -199,8 +458,9 @@ class FinanceApp:
 
     def _get_unique_categories(self) -> list[str]:
         """Return a list of unique categories from existing transactions."""
-        categories = {str(t.get("category", "")).strip() for t in self.tracker.get_transactions() if t.get("category")}
-        return sorted(categories) or ["Food", "Salary", "Transport", "Utilities", "Entertainment"]
+        # "Uncategorized" is what rows without a category are stored as
+        categories = {c.strip() for c in self.tracker.get_categories()} - {"", "Uncategorized"}
+        return sorted(categories) or ["Entertainment", "Food", "Salary", "Transport", "Utilities"]
 
     def add_transaction(self) -> None:
         """
@@ -212,15 +472,15 @@ class FinanceApp:
         amount_str = self.entry_amount.get().strip()
 
         # Input validation
-        try:
-            # Validate date format
-            datetime.strptime(date_str, "%Y-%m-%d")
-        except ValueError:
+        if not _valid_date(date_str):
             messagebox.showerror("Invalid Date", "Please enter the date in YYYY‑MM‑DD format.")
             return
         try:
             amount = float(amount_str)
         except ValueError:
+            amount = math.nan
+        # float() also accepts "inf" and "nan", which cannot be totalled
+        if not math.isfinite(amount):
             messagebox.showerror("Invalid Amount", "Please enter a valid number for the amount.")
             return
         if not description:
@@ -233,14 +493,15 @@ class FinanceApp:
         # Clear inputs for next entry
         self.entry_description.delete(0, tk.END)
         self.entry_amount.delete(0, tk.END)
-        # Add category to combobox values if it's new
-        if category not in self.combobox_category.cget("values"):
-            new_values = list(self.combobox_category.cget("values")) + [category]
-            self.combobox_category.config(values=sorted(new_values))
+        # Add category to combobox values if it's new, keeping them sorted
+        values = list(self.combobox_category.cget("values"))
+        if category not in values:
+            insort(values, category)
+            self.combobox_category.config(values=values)
 
         # Refresh views
-        self.refresh_transactions()
-        self.update_summary()
+        self.append_transaction_row(self.tracker.transactions[-1])
+        self.schedule_redraw()
 
         messagebox.showinfo("Success", "Transaction added successfully!")
 
@@ -270,13 +531,29 @@ class FinanceApp:
 
     def refresh_transactions(self) -> None:
         """Refresh the transactions displayed in the treeview."""
-        # Clear existing rows
-        for row in self.tree.get_children():
-            self.tree.delete(row)
-        # Insert updated rows
-        for idx, t in enumerate(self.tracker.get_transactions()):
-            values = (t["date"], t["description"], t["category"], f"{t['amount']:.2f}")
+        # Build the row tuples first, then insert them in one pass
+        rows = [
+            (date, description, category, f"{amount:.2f}")
+            for date, description, category, amount in self.tracker.transactions
+        ]
+        # Take the tree out of the layout while it is rebuilt so Tk lays it
+        # out once at the end instead of after every change
+        self.tree.grid_remove()
+        self.tree.delete(*self.tree.get_children())
+        for idx, values in enumerate(rows):
             self.tree.insert("", "end", iid=str(idx), values=values)
+        self.tree.grid()
+
+    def append_transaction_row(self, transaction: Transaction) -> None:
+        """Insert a single newly added transaction at the end of the treeview."""
+        idx = len(self.tracker.transactions) - 1
+        values = (
+            transaction.date,
+            transaction.description,
+            transaction.category,
+            f"{transaction.amount:.2f}",
+        )
+        self.tree.insert("", "end", iid=str(idx), values=values)
 
     # --- Summary & Analytics tab ---
     def _build_summary_tab(self) -> None:
@@ -291,9 +568,30 @@ class FinanceApp:
         # Canvas for category chart
         self.canvas = tk.Canvas(frame, height=250)
         self.canvas.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        self.canvas.bind("<Configure>", lambda event: self.draw_category_chart())
+
+    def schedule_redraw(self) -> None:
+        """Request a summary update once Tk is idle; repeated calls coalesce."""
+        if self._redraw_pending:
+            return
+        self._redraw_pending = True
+        self.master.after_idle(self._do_redraw)
+
+    def _do_redraw(self) -> None:
+        self._redraw_pending = False
+        self.update_summary()
+
+    def _on_tab_changed(self, event) -> None:
+        """Draw the category chart if it went stale while hidden."""
+        if self._summary_dirty and self.notebook.select() == str(self.tab_summary):
+            self._summary_dirty = False
+            self.draw_category_chart()
 
     def update_summary(self) -> None:
-        """Update the summary labels and redraw the category chart."""
+        """
+        Update the summary labels and redraw the category chart, or mark the
+        chart stale if the summary tab is not currently shown.
+        """
         income, expenses, net = self.tracker.compute_summary()
         self.label_income.config(text=f"Total Income: ${income:.2f}")
         self.label_expenses.config(text=f"Total Expenses: ${expenses:.2f}")
@@ -301,6 +599,9 @@ class FinanceApp:
             text=f"Net Balance: ${net:.2f}",
             foreground="green" if net >= 0 else "red",
         )
+        if self.notebook.select() != str(self.tab_summary):
+            self._summary_dirty = True
+            return
         self.draw_category_chart()
 
     def draw_category_chart(self) -> None:
@@ -309,9 +610,17 @@ class FinanceApp:
         spending per category. Both income and expenses are shown as
         absolute values.
         """
-        self.canvas.delete("all")
         breakdown = self.tracker.category_breakdown()
+        # Dimensions
+        width = int(self.canvas.winfo_width() or 600)
+        height = int(self.canvas.winfo_height() or 250)
+        # Nothing to do if the chart already shows these totals at this size
+        sig = (frozenset(breakdown.items()), width, height)
+        if sig == self._last_chart_sig:
+            return
+        self._last_chart_sig = sig
         if not breakdown:
+            self._clear_chart()
             self.canvas.create_text(
                 10,
                 10,
@@ -320,53 +629,74 @@ class FinanceApp:
                 font=("Arial", 12),
             )
             return
-        categories = list(breakdown.keys())
-        values = list(breakdown.values())
-        max_value = max(values)
-        # Dimensions
-        width = int(self.canvas.winfo_width() or 600)
-        height = int(self.canvas.winfo_height() or 250)
+        items = sorted(breakdown.items())
+        max_value = max(val for _, val in items)
         margin_x = 40
         margin_y = 40
         bar_gap = 10
-        num_bars = len(categories)
+        num_bars = len(items)
         # Avoid division by zero
         if num_bars == 0 or max_value == 0:
+            self._clear_chart()
             return
         bar_width = (width - 2 * margin_x - (num_bars - 1) * bar_gap) / num_bars
+        # Loop invariants
+        half_bar = bar_width / 2
+        y0 = height - margin_y
+        plot_height = height - 2 * margin_y
+        label_angle = 45 if num_bars > 5 else 0
+        # With the same bars at the same size only the values have changed,
+        # so move the existing items instead of recreating them
+        layout = (tuple(cat for cat, _ in items), width, height)
+        reuse = layout == self._chart_layout
+        if not reuse:
+            self._clear_chart()
+            self._chart_layout = layout
         # Draw bars
-        for i, (cat, val) in enumerate(zip(categories, values)):
+        for i, (cat, val) in enumerate(items):
             x0 = margin_x + i * (bar_width + bar_gap)
-            y0 = height - margin_y
             # Scale bar height proportionally to the max value
-            bar_height = (val / max_value) * (height - 2 * margin_y)
+            bar_height = (val / max_value) * plot_height
             y1 = y0 - bar_height
+            if reuse:
+                rect, value_label = self._chart_items[i]
+                self.canvas.coords(rect, x0, y1, x0 + bar_width, y0)
+                self.canvas.coords(value_label, x0 + half_bar, y1 - 5)
+                self.canvas.itemconfig(value_label, text=f"${val:.2f}")
+                continue
             # Draw bar rectangle (blue color)
-            self.canvas.create_rectangle(
+            rect = self.canvas.create_rectangle(
                 x0,
                 y1,
                 x0 + bar_width,
                 y0,
-                fill="#4A90E2",
+                fill=self._BAR_FILL,
                 outline="black",
             )
             # Label above bar
-            self.canvas.create_text(
-                x0 + bar_width / 2,
+            value_label = self.canvas.create_text(
+                x0 + half_bar,
                 y1 - 5,
                 text=f"${val:.2f}",
                 anchor="s",
-                font=("Arial", 8),
+                font=self._FONT_SMALL,
             )
             # Category label rotated if many bars
             self.canvas.create_text(
-                x0 + bar_width / 2,
+                x0 + half_bar,
                 y0 + 10,
                 text=cat,
                 anchor="n",
-                font=("Arial", 8),
-                angle=45 if len(categories) > 5 else 0,
+                font=self._FONT_SMALL,
+                angle=label_angle,
             )
+            self._chart_items.append((rect, value_label))
+
+    def _clear_chart(self) -> None:
+        """Remove every item from the chart canvas."""
+        self.canvas.delete("all")
+        self._chart_layout = None
+        self._chart_items = []
 
 
 def main() -> None:
@@ -376,7 +706,10 @@ def main() -> None:
         return
     root = tk.Tk()
     app = FinanceApp(root)
-    root.mainloop()
+    try:
+        root.mainloop()
+    finally:
+        app.tracker.close()
 
 
 if __name__ == "__main__":
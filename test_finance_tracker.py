@@ -0,0 +1,100 @@
+import json
+import os
+
+import pytest
+
+from finance_tracker import FinanceTracker
+
+
+@pytest.fixture
+def data_file(tmp_path):
+    return str(tmp_path / "transactions.json")
+
+
+def test_log_is_replayed_after_crash_without_close(data_file):
+    tracker = FinanceTracker(data_file)
+    tracker.add_transaction("2024-01-01", "Groceries", "Food", -25.0)
+    tracker.add_transaction("2024-01-02", "Pay", "Salary", 100.0)
+    # No close(): the JSON file was never written, only the log.
+    assert not os.path.exists(data_file)
+
+    reloaded = FinanceTracker(data_file)
+    assert [t.description for t in reloaded.transactions] == ["Groceries", "Pay"]
+    assert reloaded.compute_summary() == (100.0, 25.0, 75.0)
+
+
+def test_interrupted_compaction_does_not_duplicate(data_file):
+    tracker = FinanceTracker(data_file)
+    tracker.add_transaction("2024-01-01", "Groceries", "Food", -25.0)
+    tracker.add_transaction("2024-01-02", "Pay", "Salary", 100.0)
+    with open(tracker.log_path, "rb") as f:
+        log = f.read()
+    tracker.close()
+    # Crash after os.replace but before the log was truncated.
+    with open(tracker.log_path, "wb") as f:
+        f.write(log)
+
+    reloaded = FinanceTracker(data_file)
+    assert len(reloaded.transactions) == 2
+    reloaded.add_transaction("2024-01-03", "Bus", "Transport", -3.0)
+
+    assert len(FinanceTracker(data_file).transactions) == 3
+
+
+def test_corrupt_log_lines_are_skipped(data_file):
+    good = {"date": "2024-01-01", "description": "a", "category": "Food", "amount": -1.0}
+    later = {"date": "2024-01-02", "description": "b", "category": "Food", "amount": -2.0}
+    with open(data_file + ".log", "wb") as f:
+        f.write(json.dumps(good).encode() + b"\n")
+        f.write(b'{"date": "2024-01-0\n')
+        f.write(b"\xff\xfe not json\n")
+        f.write(json.dumps(later).encode() + b"\n")
+
+    tracker = FinanceTracker(data_file)
+    assert [t.description for t in tracker.transactions] == ["a", "b"]
+
+
+def test_add_after_batch_block(data_file):
+    tracker = FinanceTracker(data_file)
+    with tracker:
+        tracker.add_transaction("2024-01-01", "Groceries", "Food", -25.0)
+    with open(data_file, "rb") as f:
+        assert len(json.loads(f.read())) == 1
+
+    tracker.add_transaction("2024-01-02", "Pay", "Salary", 100.0)
+    tracker.close()
+    assert len(FinanceTracker(data_file).transactions) == 2
+
+
+def test_unopenable_log_keeps_transactions_in_memory(data_file):
+    # A directory in the log's place makes every open of it fail.
+    os.mkdir(data_file + ".log")
+
+    tracker = FinanceTracker(data_file)
+    tracker.add_transaction("2024-01-01", "Groceries", "Food", -25.0)
+    assert tracker.compute_summary() == (0.0, 25.0, -25.0)
+    tracker.close()
+    with open(data_file, "rb") as f:
+        assert len(json.loads(f.read())) == 1
+
+
+@pytest.mark.skipif(
+    not hasattr(os, "geteuid") or os.geteuid() == 0,
+    reason="needs a non-root POSIX user for directory permissions",
+)
+def test_read_only_directory(tmp_path, data_file):
+    with open(data_file, "w", encoding="utf-8") as f:
+        json.dump([{"date": "2024-01-01", "description": "a", "category": "Food", "amount": -1.0}], f)
+    tmp_path.chmod(0o555)
+    try:
+        tracker = FinanceTracker(data_file)
+        tracker.add_transaction("2024-01-02", "b", "Food", -2.0)
+        assert len(tracker.transactions) == 2
+        tracker.close()
+    finally:
+        tmp_path.chmod(0o755)
+
+
+def test_log_path_differs_from_jsonl_data_file(tmp_path):
+    tracker = FinanceTracker(str(tmp_path / "transactions.jsonl"))
+    assert tracker.log_path != tracker.file_path